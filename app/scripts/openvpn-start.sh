@@ -27,31 +27,42 @@ if [ ! -f "${SERVER_CONF_DIR}/server.conf" ]; then # Si no existe el archivo de
     exit 1 # Termina con error
 fi
 
+# Verificar si OpenVPN ya esta en ejecucion segun el archivo PID
+# El archivo puede quedar obsoleto tras un reinicio del contenedor, por lo que ademas de que el
+# PID este vivo se comprueba en /proc que el proceso sea realmente openvpn
+OLD_PID=$(cat "${OPENVPN_PID_FILE}" 2>/dev/null) # Lee el PID guardado una sola vez
+if [ -n "$OLD_PID" ] && kill -0 "$OLD_PID" 2>/dev/null \
+    && [ "$(cat "/proc/$OLD_PID/comm" 2>/dev/null)" = "openvpn" ]; then # Si el PID guardado es un openvpn vivo
+    echo "⚠️ OpenVPN ya esta en ejecucion (PID: $OLD_PID)."
+    echo "Detenga el servicio con openvpn-stop.sh antes de volver a iniciarlo."
+    exit 0 # No es un error: el servicio ya esta activo
+fi
+
 # Iniciar OpenVPN en segundo plano con `--daemon`
-openvpn --config "${SERVER_CONF_DIR}/server.conf" --daemon # Inicia OpenVPN en segundo plano
+# `--writepid` hace que OpenVPN guarde su propio PID, sin recorrer la tabla de procesos
+rm -f "${OPENVPN_PID_FILE}" # Elimina un PID antiguo (proceso ya terminado) para no confundirlo con el nuevo
+openvpn --config "${SERVER_CONF_DIR}/server.conf" --daemon --writepid "${OPENVPN_PID_FILE}" # Inicia OpenVPN en segundo plano
 
 # Esperar 2 segundos para que OpenVPN cree el proceso
 sleep 2 # Pausa para dar tiempo a que OpenVPN inicie
 
-# Obtener el PID del proceso OpenVPN
-PID=$(pgrep -f "openvpn --config ${SERVER_CONF_DIR}/server.conf") # Obtiene el ID del proceso
+# Obtener el PID del proceso OpenVPN desde el archivo PID
+PID=$(cat "${OPENVPN_PID_FILE}" 2>/dev/null) # Obtiene el ID del proceso
 
-if [ -z "$PID" ]; then # Si no se encontro el PID
+if [ -z "$PID" ] || ! kill -0 "$PID" 2>/dev/null \
+    || [ "$(cat "/proc/$PID/comm" 2>/dev/null)" != "openvpn" ]; then # Si no hay PID o el proceso no es openvpn
     echo "❌ Error: OpenVPN no se esta ejecutando."
     echo "Revise los logs en ${LOGS_DIR}/openvpn.log para mas informacion."
     exit 1 # Termina con error
 fi
 
-# Guardar el PID
-echo "$PID" > "${OPENVPN_PID_FILE}" # Guarda el PID en un archivo
-
 echo "✅ OpenVPN iniciado correctamente en segundo plano (PID: $PID)."
 
 # Esperar unos segundos para asegurar que OpenVPN establezca la red
 sleep 3 # Pausa para dar tiempo a que se establezca la interfaz de red
 
 # Verificar si la interfaz TUN esta activa
-if ip a show "${TUN_DEVICE}" > /dev/null 2>&1; then # Si existe la interfaz TUN
+if [ -n "${TUN_DEVICE}" ] && [ -d "/sys/class/net/${TUN_DEVICE}" ]; then # Si existe la interfaz TUN (consulta directa a sysfs)
     echo "🔍 Estado de la interfaz TUN:"
     ip a show "${TUN_DEVICE}" # Muestra informacion de la interfaz
 
@@ -69,7 +69,7 @@ if pgrep -f "openvpn.*server.conf" > /dev/null; then # Busca procesos OpenVPN en
 fi
 
 # Verificar si la interfaz TUN esta activa
-if ip link show "${TUN_DEVICE}" >/dev/null 2>&1; then # Verifica si la interfaz TUN existe
+if [ -n "${TUN_DEVICE}" ] && [ -d "/sys/class/net/${TUN_DEVICE}" ]; then # Verifica si la interfaz TUN existe (consulta directa a sysfs)
     echo "🔌 Desactivando interfaz ${TUN_DEVICE}..."
     if ! ip link set "${TUN_DEVICE}" down; then # Desactiva la interfaz TUN
         handle_error "No se pudo desactivar la interfaz ${TUN_DEVICE}"